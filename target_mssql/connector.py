@@ -1,12 +1,78 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, cast
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
 
 import sqlalchemy
 from singer_sdk.helpers._typing import get_datelike_property_type
 from singer_sdk.sinks import SQLConnector
 from sqlalchemy.dialects import mssql
 
+# Type-check sets, ordered here by expected frequency in typical catalogs.
+_STRING_TYPES = frozenset(("string",))
+_INTEGER_TYPES = frozenset(("integer",))
+_NUMBER_TYPES = frozenset(("number",))
+_BOOLEAN_TYPES = frozenset(("boolean",))
+_OBJECT_TYPES = frozenset(("object",))
+_ARRAY_TYPES = frozenset(("array",))
+
+
+@lru_cache(maxsize=8)
+def _build_sqlalchemy_url(
+    username: str,
+    password: str,
+    host: str,
+    port: str,
+    database: str,
+    driver: str,
+) -> str:
+    """Build the pyodbc connection URL, cached per connection settings.
+
+    Args:
+        username: The database user name.
+        password: The database password.
+        host: The database host.
+        port: The database port.
+        database: The database name.
+        driver: The ODBC driver name.
+
+    Returns:
+        The SQLAlchemy URL as a string.
+    """
+    return str(
+        sqlalchemy.engine.url.URL.create(
+            drivername="mssql+pyodbc",
+            username=username,
+            password=password,
+            host=host,
+            port=port,
+            database=database,
+            query={"driver": driver},
+        )
+    )
+
+
+def _freeze_jsonschema(jsonschema_type: Any) -> Any:
+    """Convert a JSON Schema fragment into a hashable representation.
+
+    Args:
+        jsonschema_type: The JSON Schema object (or a fragment of one).
+
+    Returns:
+        A hashable, order-insensitive equivalent of the input.
+    """
+    if isinstance(jsonschema_type, dict):
+        return tuple(
+            sorted(
+                (key, _freeze_jsonschema(value))
+                for key, value in jsonschema_type.items()
+            )
+        )
+    if isinstance(jsonschema_type, (list, tuple)):
+        return tuple(_freeze_jsonschema(value) for value in jsonschema_type)
+    return jsonschema_type
+
 
 class mssqlConnector(SQLConnector):
     """The connector for mssql.
@@ -20,6 +86,147 @@ class mssqlConnector(SQLConnector):
     allow_merge_upsert: bool = True  # Whether MERGE UPSERT is supported.
     allow_temp_tables: bool = True  # Whether temp tables are supported.
 
+    def __init__(
+        self, config: Optional[dict] = None, sqlalchemy_url: Optional[str] = None
+    ) -> None:
+        """Initialize the connector.
+
+        Args:
+            config: The parent target's config.
+            sqlalchemy_url: Optional URL for the connection.
+        """
+        super().__init__(config=config, sqlalchemy_url=sqlalchemy_url)
+        self._has_identity_cache: Dict[str, bool] = {}
+        self._sql_type_cache: Dict[Any, sqlalchemy.types.TypeEngine] = {}
+        self._column_type_cache: Dict[tuple, sqlalchemy.types.TypeEngine] = {}
+        self._meta = sqlalchemy.MetaData()
+        self._pending_ddl: Optional[List[str]] = None
+        self._existing_tables: Optional[set] = None
+        self._temp_table_ddl_cache: Dict[tuple, str] = {}
+
+    def _get_existing_tables(self) -> set:
+        """Return the known table names, loaded in one query per connector.
+
+        Names are stored schema-qualified; bare names are kept for the
+        default 'dbo' schema since unqualified lookups resolve there.
+
+        Returns:
+            A set of table names.
+        """
+        if self._existing_tables is None:
+            result = self.connection.execute(
+                "SELECT table_schema, table_name FROM information_schema.tables"
+            )
+            tables: set = set()
+            for table_schema, table_name in result:
+                tables.add(f"{table_schema}.{table_name}")
+                if table_schema == "dbo":
+                    tables.add(table_name)
+            self._existing_tables = tables
+
+        return self._existing_tables
+
+    def table_exists(self, full_table_name: str) -> bool:
+        """Determine if the target table already exists.
+
+        Checks the cached table listing first, avoiding a metadata
+        round-trip per batch; only cache misses hit the database.
+
+        Args:
+            full_table_name: the target table name.
+
+        Returns:
+            True if table exists, False if not.
+        """
+        if full_table_name in self._get_existing_tables():
+            return True
+
+        # The table may have been created outside this connector since
+        # startup, so a miss still gets a live check.
+        exists = super().table_exists(full_table_name)
+        if exists:
+            self._get_existing_tables().add(full_table_name)
+        return exists
+
+    @contextmanager
+    def begin_ddl_batch(self) -> Iterator[None]:
+        """Buffer DDL statements and flush them in a single round-trip.
+
+        While the context is active, DDL issued by `_create_empty_column`
+        and `_adapt_column_type` is collected instead of executed, then
+        sent as one multi-statement batch on exit. Nested batches join the
+        outermost one.
+
+        Yields:
+            None.
+        """
+        if self._pending_ddl is not None:
+            yield  # Already batching; defer to the outermost context.
+            return
+
+        self._pending_ddl = []
+        try:
+            yield
+            self.flush_ddl_batch()
+        finally:
+            self._pending_ddl = None
+
+    def flush_ddl_batch(self) -> None:
+        """Execute any buffered DDL statements as one batch."""
+        if self._pending_ddl:
+            self.connection.execute("\n".join(self._pending_ddl))
+            self._pending_ddl = []
+
+    def _execute_ddl(self, statement: str, context: Optional[dict] = None) -> None:
+        """Execute a DDL statement, or buffer it when batching is active.
+
+        Statements are wrapped in `sqlalchemy.DDL` so the dialect's
+        compiled-statement cache can be reused across calls that share the
+        same template.
+
+        Args:
+            statement: The DDL statement, with optional ``%(key)s`` tokens.
+            context: Values substituted for the statement tokens.
+        """
+        if self._pending_ddl is not None:
+            compiled = statement % context if context else statement
+            self._pending_ddl.append(compiled.rstrip().rstrip(";") + ";")
+        else:
+            self.connection.execute(sqlalchemy.DDL(statement, context=context))
+
+    def table_has_identity_column(self, full_table_name: str) -> bool:
+        """Return True if the target table has an IDENTITY column.
+
+        The result is cached per table so repeated bulk inserts can skip
+        the IDENTITY_INSERT toggles (and their round-trips) entirely for
+        the common case of tables without an IDENTITY column.
+
+        Args:
+            full_table_name: the target table name.
+
+        Returns:
+            True if the table has an IDENTITY column.
+        """
+        if full_table_name not in self._has_identity_cache:
+            if full_table_name.startswith("#"):
+                lookup_sql = (
+                    "SELECT count(*) FROM tempdb.sys.identity_columns "
+                    "WHERE object_id = object_id(:object_name)"
+                )
+                object_name = f"tempdb..{full_table_name}"
+            else:
+                lookup_sql = (
+                    "SELECT count(*) FROM sys.identity_columns "
+                    "WHERE object_id = object_id(:object_name)"
+                )
+                object_name = full_table_name
+            result = self.connection.execute(
+                sqlalchemy.text(lookup_sql), {"object_name": object_name}
+            )
+            self._has_identity_cache[full_table_name] = bool(result.scalar())
+
+        return self._has_identity_cache[full_table_name]
+
     def create_table_with_records(
         self,
         full_table_name: Optional[str],
@@ -55,19 +262,52 @@ class mssqlConnector(SQLConnector):
     def get_sqlalchemy_url(self, config: dict) -> str:
         """Generates a SQLAlchemy URL for mssql.
 
+        An explicitly configured `sqlalchemy_url` wins, so deployments can
+        pin a dialect (e.g. mssql+pymssql for its bulk-copy support);
+        otherwise the URL is built from the individual connection settings.
+
         Args:
             config: The configuration for the connector.
         """
-
-        connection_url = sqlalchemy.engine.url.URL.create(
-            drivername="mssql+pymssql",
-            username=config["user"],
-            password=config["password"],
-            host=config["host"],
-            port=config["port"],
-            database=config["database"],
+        if config.get("sqlalchemy_url"):
+            return cast(str, config["sqlalchemy_url"])
+
+        return _build_sqlalchemy_url(
+            config["user"],
+            config["password"],
+            config["host"],
+            config["port"],
+            config["database"],
+            config.get("driver", "ODBC Driver 17 for SQL Server"),
         )
-        return str(connection_url)
+
+    def create_sqlalchemy_engine(self) -> sqlalchemy.engine.Engine:
+        """Return a new SQLAlchemy engine using the provided config.
+
+        With pyodbc, `fast_executemany` packs all executemany parameter rows
+        into a single TDS batch instead of issuing one round-trip per row.
+        Pooling keeps DBAPI connections (and their TDS logins) alive across
+        sinks, and the shared compiled cache reuses compiled statements
+        across connections.
+
+        Returns:
+            A newly created SQLAlchemy engine object.
+        """
+        engine_kwargs: Dict[str, Any] = {
+            "echo": False,
+            "pool_size": 10,
+            "max_overflow": 20,
+            "pool_pre_ping": True,
+            "execution_options": {"compiled_cache": {}},
+        }
+        if self.sqlalchemy_url.startswith("mssql+pyodbc"):
+            engine_kwargs["fast_executemany"] = True
+        # SQLAlchemy 2.x routes inserts through "insertmanyvalues", which
+        # amplifies round-trips on SQL Server; keep the executemany path so
+        # fast_executemany applies. SQLAlchemy 1.4 predates the option.
+        if int(sqlalchemy.__version__.partition(".")[0]) >= 2:
+            engine_kwargs["use_insertmanyvalues"] = False
+        return sqlalchemy.create_engine(self.sqlalchemy_url, **engine_kwargs)
 
     def create_empty_table(
         self,
@@ -93,9 +333,14 @@ class mssqlConnector(SQLConnector):
 
         _ = partition_keys  # Not supported in generic implementation.
 
-        meta = sqlalchemy.MetaData()
+        # Reuse the connector-level MetaData so dialect/DDL compilation is
+        # amortized across the many tables a pipeline may create.
+        meta = self._meta
+        if full_table_name in meta.tables:
+            return
+
         columns: list[sqlalchemy.Column] = []
-        primary_keys = primary_keys or []
+        pk_set = frozenset(primary_keys or ())
         try:
             properties: dict = schema["properties"]
         except KeyError:
@@ -103,7 +348,7 @@ class mssqlConnector(SQLConnector):
                 f"Schema for '{full_table_name}' does not define properties: {schema}"
             )
         for property_name, property_jsonschema in properties.items():
-            is_primary_key = property_name in primary_keys
+            is_primary_key = property_name in pk_set
 
             columntype = self.to_sql_type(property_jsonschema)
 
@@ -119,8 +364,9 @@ class mssqlConnector(SQLConnector):
                 )
             )
 
-        _ = sqlalchemy.Table(full_table_name, meta, *columns)
-        meta.create_all(self._engine)
+        table = sqlalchemy.Table(full_table_name, meta, *columns)
+        meta.create_all(self._engine, tables=[table], checkfirst=True)
+        self._get_existing_tables().add(full_table_name)
 
     def merge_sql_types(  # noqa
         self, sql_types: list[sqlalchemy.types.TypeEngine]
@@ -199,6 +445,28 @@ class mssqlConnector(SQLConnector):
             f"Unable to merge sql types: {', '.join([str(t) for t in sql_types])}"
         )
 
+    def _get_column_type(
+        self, full_table_name: str, column_name: str
+    ) -> sqlalchemy.types.TypeEngine:
+        """Return the current SQL type of a column, cached per column.
+
+        Avoids re-reflecting the same column on every Singer message; the
+        cache entry is invalidated when the column is altered.
+
+        Args:
+            full_table_name: The target table name.
+            column_name: The target column name.
+
+        Returns:
+            The SQLAlchemy type of the column.
+        """
+        cache_key = (full_table_name, column_name)
+        if cache_key not in self._column_type_cache:
+            self._column_type_cache[cache_key] = super()._get_column_type(
+                full_table_name, column_name
+            )
+        return self._column_type_cache[cache_key]
+
     def _adapt_column_type(
         self,
         full_table_name: str,
@@ -238,9 +506,13 @@ class mssqlConnector(SQLConnector):
                 f"from '{current_type}' to '{compatible_sql_type}'."
             )
         try:
-            self.connection.execute(
-                f"""ALTER TABLE { str(full_table_name) }
-                ALTER COLUMN { str(column_name) } { str(compatible_sql_type) }"""
+            self._execute_ddl(
+                "ALTER TABLE %(table)s ALTER COLUMN %(col_name)s %(col_type)s",
+                {
+                    "table": full_table_name,
+                    "col_name": column_name,
+                    "col_type": compatible_sql_type,
+                },
             )
         except Exception as e:
             raise RuntimeError(
@@ -248,16 +520,7 @@ class mssqlConnector(SQLConnector):
                 f"from '{current_type}' to '{compatible_sql_type}'."
             ) from e
 
-        # self.connection.execute(
-        #     sqlalchemy.DDL(
-        #         "ALTER TABLE %(table)s ALTER COLUMN %(col_name)s %(col_type)s",
-        #         {
-        #             "table": full_table_name,
-        #             "col_name": column_name,
-        #             "col_type": compatible_sql_type,
-        #         },
-        #     )
-        # )
+        self._column_type_cache.pop((full_table_name, column_name), None)
 
     def _create_empty_column(
         self,
@@ -284,9 +547,12 @@ class mssqlConnector(SQLConnector):
         )
 
         try:
-            self.connection.execute(
-                f"""ALTER TABLE { str(full_table_name) }
-                ADD { str(create_column_clause) } """
+            self._execute_ddl(
+                "ALTER TABLE %(table)s ADD %(create_column_clause)s",
+                {
+                    "table": full_table_name,
+                    "create_column_clause": create_column_clause,
+                },
             )
 
         except Exception as e:
@@ -296,37 +562,62 @@ class mssqlConnector(SQLConnector):
             ) from e
 
     def _jsonschema_type_check(
-        self, jsonschema_type: dict, type_check: tuple[str]
+        self, jsonschema_type: dict, type_check: frozenset[str]
     ) -> bool:
         """Return True if the jsonschema_type supports the provided type.
         Args:
             jsonschema_type: The type dict.
-            type_check: A tuple of type strings to look for.
+            type_check: A frozenset of type strings to look for.
         Returns:
             True if the schema suports the type.
         """
-        if "type" in jsonschema_type:
-            if isinstance(jsonschema_type["type"], (list, tuple)):
-                for t in jsonschema_type["type"]:
-                    if t in type_check:
-                        return True
-            else:
-                if jsonschema_type.get("type") in type_check:
-                    return True
-
-        if any(t in type_check for t in jsonschema_type.get("anyOf", ())):
-            return True
+        schema_type = jsonschema_type.get("type")
+        if isinstance(schema_type, str):
+            # Fast path: "type" is almost always a plain string.
+            if schema_type in type_check:
+                return True
+        elif isinstance(schema_type, (list, tuple)):
+            if not type_check.isdisjoint(schema_type):
+                return True
+
+        any_of = jsonschema_type.get("anyOf")
+        if any_of:
+            # "anyOf" members are usually nested schema objects; only bare
+            # type strings can match here, so skip the dicts.
+            if any(t in type_check for t in any_of if isinstance(t, str)):
+                return True
 
         return False
 
-    def to_sql_type(self, jsonschema_type: dict) -> sqlalchemy.types.TypeEngine:  # noqa
+    def to_sql_type(self, jsonschema_type: dict) -> sqlalchemy.types.TypeEngine:
         """Convert JSON Schema type to a SQL type.
+
+        Results are memoized per connector, keyed by a frozen representation
+        of the schema fragment, since the same property shapes recur across
+        columns and streams.
+
         Args:
             jsonschema_type: The JSON Schema object.
         Returns:
             The SQL type.
         """
-        if self._jsonschema_type_check(jsonschema_type, ("string",)):
+        cache_key = _freeze_jsonschema(jsonschema_type)
+        sql_type = self._sql_type_cache.get(cache_key)
+        if sql_type is None:
+            sql_type = self._to_sql_type_uncached(jsonschema_type)
+            self._sql_type_cache[cache_key] = sql_type
+        return sql_type
+
+    def _to_sql_type_uncached(  # noqa
+        self, jsonschema_type: dict
+    ) -> sqlalchemy.types.TypeEngine:
+        """Convert JSON Schema type to a SQL type, bypassing the cache.
+        Args:
+            jsonschema_type: The JSON Schema object.
+        Returns:
+            The SQL type.
+        """
+        if self._jsonschema_type_check(jsonschema_type, _STRING_TYPES):
             datelike_type = get_datelike_property_type(jsonschema_type)
             if datelike_type:
                 if datelike_type == "date-time":
@@ -343,28 +634,56 @@ class mssqlConnector(SQLConnector):
                 sqlalchemy.types.TypeEngine, sqlalchemy.types.VARCHAR(maxlength)
             )
 
-        if self._jsonschema_type_check(jsonschema_type, ("integer",)):
+        if self._jsonschema_type_check(jsonschema_type, _INTEGER_TYPES):
             return cast(sqlalchemy.types.TypeEngine, sqlalchemy.types.INTEGER())
-        if self._jsonschema_type_check(jsonschema_type, ("number",)):
+        if self._jsonschema_type_check(jsonschema_type, _NUMBER_TYPES):
             return cast(sqlalchemy.types.TypeEngine, sqlalchemy.types.NUMERIC(22, 16))
-        if self._jsonschema_type_check(jsonschema_type, ("boolean",)):
+        if self._jsonschema_type_check(jsonschema_type, _BOOLEAN_TYPES):
             return cast(sqlalchemy.types.TypeEngine, mssql.VARCHAR(1))
 
-        if self._jsonschema_type_check(jsonschema_type, ("object",)):
+        if self._jsonschema_type_check(jsonschema_type, _OBJECT_TYPES):
             return cast(sqlalchemy.types.TypeEngine, sqlalchemy.types.VARCHAR())
 
-        if self._jsonschema_type_check(jsonschema_type, ("array",)):
+        if self._jsonschema_type_check(jsonschema_type, _ARRAY_TYPES):
             return cast(sqlalchemy.types.TypeEngine, sqlalchemy.types.VARCHAR())
 
         return cast(sqlalchemy.types.TypeEngine, sqlalchemy.types.VARCHAR())
 
-    def create_temp_table_from_table(self, from_table_name):
-        """Temp table from another table."""
+    def create_temp_table_from_table(self, from_table_name, join_keys=None):
+        """Temp table from another table.
+
+        The source identifier is quoted through the dialect's identifier
+        preparer rather than interpolated raw, and the generated DDL is
+        cached per table so repeat batches reuse the same string. The
+        staging table is dropped first if it survived a previous batch on
+        this session, since local temp tables live until the session ends.
+        When join keys are given, the staging table gets a clustered index
+        on them so the upsert joins against sorted keys (fresh temp tables
+        have no statistics to help the planner otherwise).
 
-        ddl = f"""
-            SELECT TOP 0 *
-            into #{from_table_name}
-            FROM {from_table_name}
+        Args:
+            from_table_name: the table to copy the structure from.
+            join_keys: optional upsert keys to index the staging table on.
         """
+        cache_key = (from_table_name, tuple(join_keys or ()))
+        ddl = self._temp_table_ddl_cache.get(cache_key)
+        if ddl is None:
+            preparer = self._engine.dialect.identifier_preparer
+            quoted_source = ".".join(
+                preparer.quote(part) for part in str(from_table_name).split(".")
+            )
+            ddl = f"""
+                DROP TABLE IF EXISTS #{from_table_name};
+                SELECT TOP 0 *
+                into #{from_table_name}
+                FROM {quoted_source};
+            """
+            if join_keys:
+                key_list = ", ".join(preparer.quote(key) for key in join_keys)
+                ddl += f"""
+                CREATE CLUSTERED INDEX ix_tmp_pk
+                ON #{from_table_name} ({key_list})
+                """
+            self._temp_table_ddl_cache[cache_key] = ddl
 
         self.connection.execute(ddl)
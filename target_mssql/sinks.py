@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import sqlalchemy
 from singer_sdk.sinks import SQLSink
@@ -11,11 +13,113 @@ from sqlalchemy import Column
 from target_mssql.connector import mssqlConnector
 
 
+def _upsert_option_clause(batch_size: Optional[int]) -> str:
+    """Pick the query hint for an upsert batch.
+
+    Fresh staging tables carry no statistics, so small batches ask for a
+    recompiled plan and large ones for a hash join outright.
+
+    Args:
+        batch_size: Number of staged records, if known.
+
+    Returns:
+        An OPTION clause string.
+    """
+    if batch_size is not None and batch_size < 1000:
+        return "OPTION (RECOMPILE)"
+    return "OPTION (HASH JOIN)"
+
+
+def _render_upsert_sql(
+    from_table_name: str,
+    to_table_name: str,
+    properties: List[str],
+    join_keys: List[str],
+    option_clause: str,
+    quote: Callable[[str], str],
+) -> str:
+    """Render the update/delete-matched/insert upsert batch.
+
+    Schema-derived identifiers are quoted through the dialect's preparer:
+    consistent bracketing means identically-shaped streams produce
+    identical SQL for the server's plan cache, and property names are not
+    interpolated raw. The UPDATE is omitted when every column is a join
+    key, since there is nothing left to set.
+
+    Args:
+        from_table_name: The source (staging) table name.
+        to_table_name: The destination table name.
+        properties: The schema property names, in column order.
+        join_keys: The merge upsert keys.
+        option_clause: The OPTION clause to append to the joined statements.
+        quote: The dialect's identifier quoting function.
+
+    Returns:
+        The statements joined into one multi-statement batch.
+    """
+    join_condition = " and ".join(
+        [f"temp.{quote(key)} = target.{quote(key)}" for key in join_keys]
+    )
+
+    update_stmt = ", ".join(
+        [
+            f"target.{quote(key)} = temp.{quote(key)}"
+            for key in properties
+            if key not in join_keys
+        ]
+    )  # noqa
+
+    property_names = ", ".join([quote(key) for key in properties])
+    select_stmt = ", ".join([f"temp.{quote(key)}" for key in properties])
+
+    update_sql = f"""
+        UPDATE target
+        SET { update_stmt }
+        FROM {to_table_name} AS target WITH (TABLOCK, HOLDLOCK)
+        INNER JOIN {from_table_name} AS temp
+        ON {join_condition}
+        {option_clause};
+    """
+    delete_sql = f"""
+        DELETE temp
+        FROM {from_table_name} AS temp
+        INNER JOIN {to_table_name} AS target
+        ON {join_condition}
+        {option_clause};
+    """
+    insert_sql = f"""
+        INSERT INTO {to_table_name} WITH (TABLOCK)
+        ({ property_names })
+        SELECT { select_stmt }
+        FROM {from_table_name} AS temp;
+    """
+
+    # One multi-statement batch: a single round-trip instead of three.
+    return "\n".join(([update_sql] if update_stmt else []) + [delete_sql, insert_sql])
+
+
 class mssqlSink(SQLSink):
     """mssql target sink class."""
 
     connector_class = mssqlConnector
 
+    bulk_copy_min_rows: int = 5000  # Minimum batch size for the bulk-copy path.
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the sink.
+
+        Args:
+            args: Positional arguments for the SQLSink initializer.
+            kwargs: Keyword arguments for the SQLSink initializer.
+        """
+        super().__init__(*args, **kwargs)
+        self._insert_stmt_cache: Dict[tuple, Any] = {}
+        self._merge_sql_cache: Dict[tuple, str] = {}
+        self._projector_cache: Dict[tuple, Any] = {}
+        self._columns_cache: Dict[tuple, List[Column]] = {}
+        self._identity_on_for: Optional[str] = None
+        self._logged_batch_size = False
+
     # Copied purely to help with type hints
     @property
     def connector(self) -> mssqlConnector:
@@ -83,54 +187,240 @@ class mssqlSink(SQLSink):
                 names.
             records: the input records.
         Returns:
-            True if table exists, False if not, None if unsure or undetectable.
+            The number of records inserted.
         """
-        insert_sql = self.generate_insert_statement(
-            full_table_name,
-            schema,
-        )
-        if isinstance(insert_sql, str):
-            insert_sql = sqlalchemy.text(insert_sql)
-
-        self.logger.info("Inserting with SQL: %s", insert_sql)
+        insert_sql = self._get_insert_statement(full_table_name, schema)
 
         columns = self.column_representation(schema)
+        column_names = [column.name for column in columns]
+
+        # Both paths bind per row set (executemany) or bypass binding
+        # entirely (bulk copy), so SQL Server's 2100 bound-parameter
+        # statement cap never applies here and the configured size stands.
+        batch_size = self.config.get("bulk_insert_batch_size", 10000)
+        use_bulk_copy = self._supports_bulk_copy()
+        if not self._logged_batch_size:
+            self.logger.info(
+                "Inserting in batches of %d rows (%d columns)",
+                batch_size,
+                len(column_names),
+            )
+            self._logged_batch_size = True
+
+        has_identity = bool(
+            self.key_properties
+        ) and self.connector.table_has_identity_column(full_table_name)
+
+        if has_identity:
+            self._enable_identity_insert(full_table_name)
+
+        record_count = 0
+        record_iter = iter(records)
+
+        # Marshal the next chunk while the previous one is in flight, so
+        # CPU-side dict building overlaps the network round-trip. Inside
+        # the loop only the worker thread touches the connection.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: Optional[Future] = None
+            while True:
+                chunk = list(islice(record_iter, batch_size))
+                if not chunk:
+                    break
+                record_count += len(chunk)
+
+                # temporary fix to ensure missing properties are added
+                insert_records = [
+                    {name: record.get(name) for name in column_names}
+                    for record in chunk
+                ]
+
+                if pending is not None:
+                    pending.result()
+                pending = executor.submit(
+                    self._send_chunk,
+                    full_table_name,
+                    insert_sql,
+                    columns,
+                    insert_records,
+                    use_bulk_copy,
+                )
 
-        # temporary fix to ensure missing properties are added
-        insert_records = []
-        for record in records:
-            insert_record = {}
-            for column in columns:
-                insert_record[column.name] = record.get(column.name)
-            insert_records.append(insert_record)
+            if pending is not None:
+                pending.result()
 
-        if self.key_properties:
-            self.connection.execute(f"SET IDENTITY_INSERT { full_table_name } ON")
+        return record_count
+
+    def _send_chunk(
+        self,
+        full_table_name: str,
+        insert_sql: Any,
+        columns: List[Column],
+        insert_records: List[Dict[str, Any]],
+        use_bulk_copy: bool,
+    ) -> None:
+        """Send one marshalled chunk to the target table.
+
+        Args:
+            full_table_name: the target table name.
+            insert_sql: the prepared insert statement.
+            columns: the target columns, in insert order.
+            insert_records: the marshalled records.
+            use_bulk_copy: True if the driver supports bulk copy.
+        """
+        if use_bulk_copy and len(insert_records) >= self.bulk_copy_min_rows:
+            # A failed bulk copy may already have applied part of the chunk
+            # inside the open per-batch transaction; roll back to a savepoint
+            # before falling back so the INSERT cannot duplicate those rows.
+            savepoint = self.connection.begin_nested()
+            try:
+                self._bulk_copy_records(full_table_name, columns, insert_records)
+            except Exception as e:
+                savepoint.rollback()
+                self.logger.warning(
+                    "Bulk copy into %s failed, falling back to INSERT: %s",
+                    full_table_name,
+                    e,
+                )
+            else:
+                savepoint.commit()
+                return
 
         self.connection.execute(insert_sql, insert_records)
 
-        if self.key_properties:
-            self.connection.execute(f"SET IDENTITY_INSERT { full_table_name } OFF")
+    def _enable_identity_insert(self, full_table_name: str) -> None:
+        """Turn on IDENTITY_INSERT for the table, unless it already is.
+
+        Only one table per session can have IDENTITY_INSERT enabled, so
+        switching tables turns the previous one off first. Consecutive
+        batches into the same table skip the toggles entirely.
+
+        Args:
+            full_table_name: the table to enable identity inserts on.
+        """
+        if self._identity_on_for == full_table_name:
+            if not full_table_name.startswith("#"):
+                return
+            # Local temp tables are recreated per batch, so re-enable.
+        elif self._identity_on_for is not None:
+            self.connection.execute(
+                f"SET IDENTITY_INSERT { self._identity_on_for } OFF"
+            )
+
+        self.connection.execute(f"SET IDENTITY_INSERT { full_table_name } ON")
+        self._identity_on_for = full_table_name
+
+    def _disable_identity_insert(self) -> None:
+        """Turn off IDENTITY_INSERT if it is enabled for any table."""
+        if self._identity_on_for is not None:
+            self.connection.execute(
+                f"SET IDENTITY_INSERT { self._identity_on_for } OFF"
+            )
+            self._identity_on_for = None
+
+    def clean_up(self) -> None:
+        """Perform any clean up actions required at end of a stream."""
+        self._disable_identity_insert()
+        super().clean_up()
+
+    def _get_insert_statement(self, full_table_name: str, schema: dict) -> Any:
+        """Return the INSERT statement for the table, cached per schema shape.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema for the table.
+
+        Returns:
+            A `sqlalchemy.text` insert statement.
+        """
+        cache_key = (full_table_name, tuple(sorted(schema["properties"])))
+        insert_sql = self._insert_stmt_cache.get(cache_key)
+        if insert_sql is None:
+            insert_sql = self.generate_insert_statement(full_table_name, schema)
+            if isinstance(insert_sql, str):
+                insert_sql = sqlalchemy.text(insert_sql)
+            self.logger.info("Inserting with SQL: %s", insert_sql)
+            self._insert_stmt_cache[cache_key] = insert_sql
+        return insert_sql
+
+    def _get_row_projector(self, column_names: List[str]) -> Any:
+        """Return a compiled row projector for the given columns.
+
+        Generates, once per column tuple, a function whose body reads each
+        column by name - no per-column Python loop remains at call time.
+        Missing keys still project as None via dict.get.
 
-        if isinstance(records, list):
-            return len(records)  # If list, we can quickly return record count.
+        Args:
+            column_names: the column names, in insert order.
+
+        Returns:
+            A callable mapping a record dict to a value tuple.
+        """
+        cache_key = tuple(column_names)
+        projector = self._projector_cache.get(cache_key)
+        if projector is None:
+            body = ", ".join(f"record.get({name!r})" for name in column_names)
+            source = f"def _project(record):\n    return ({body},)"
+            namespace: Dict[str, Any] = {}
+            exec(compile(source, "<row_projector>", "exec"), namespace)
+            projector = namespace["_project"]
+            self._projector_cache[cache_key] = projector
+        return projector
+
+    def _supports_bulk_copy(self) -> bool:
+        """Return True if the underlying DBAPI connection exposes bulk copy.
+
+        Returns:
+            True if the driver supports the TDS bulk-load protocol.
+        """
+        return hasattr(self.connection.connection, "bulk_copy")
+
+    def _bulk_copy_records(
+        self,
+        full_table_name: str,
+        columns: List[Column],
+        records: List[Dict[str, Any]],
+    ) -> None:
+        """Stream records into the table via the TDS bulk-load protocol.
 
-        return None  # Unknown record count.
+        Bypasses per-row statement parsing and parameter binding entirely
+        (pymssql 2.2.8+ exposes this as `Connection.bulk_copy`).
+
+        Args:
+            full_table_name: the target table name.
+            columns: the target columns, in insert order.
+            records: the records to load.
+        """
+        project = self._get_row_projector([column.name for column in columns])
+        rows = [project(record) for record in records]
+        self.connection.connection.bulk_copy(
+            full_table_name,
+            rows,
+            batch_size=self.config.get("bulkcopy_batch_size", 50000),
+        )
 
     def column_representation(
         self,
         schema: dict,
     ) -> List[Column]:
-        """Returns a sql alchemy table representation for the current schema."""
-        columns: list[Column] = []
-        conformed_properties = self.conform_schema(schema)["properties"]
-        for property_name, property_jsonschema in conformed_properties.items():
-            columns.append(
-                Column(
-                    property_name,
-                    self.connector.to_sql_type(property_jsonschema),
+        """Returns a sql alchemy table representation for the current schema.
+
+        Cached per property set: the stream's schema is fixed for the
+        sink's lifetime, so conformance and type mapping run once rather
+        than once per batch.
+        """
+        cache_key = tuple(schema["properties"])
+        columns = self._columns_cache.get(cache_key)
+        if columns is None:
+            columns = []
+            conformed_properties = self.conform_schema(schema)["properties"]
+            for property_name, property_jsonschema in conformed_properties.items():
+                columns.append(
+                    Column(
+                        property_name,
+                        self.connector.to_sql_type(property_jsonschema),
+                    )
                 )
-            )
+            self._columns_cache[cache_key] = columns
         return columns
 
     def process_batch(self, context: dict) -> None:
@@ -144,39 +434,49 @@ class mssqlSink(SQLSink):
 
         if self.key_properties:
             self.logger.info(f"Preparing table {self.full_table_name}")
-            self.connector.prepare_table(
-                full_table_name=self.full_table_name,
-                schema=self.schema,
-                primary_keys=self.key_properties,
-                as_temp_table=False,
-            )
-            # Create a temp table (Creates from the table above)
-            self.logger.info(f"Creating temp table {self.full_table_name}")
-            self.connector.create_temp_table_from_table(
-                from_table_name=self.full_table_name
-            )
-            # Insert into temp table
-            self.logger.info("Inserting into temp table")
-            self.bulk_insert_records(
-                full_table_name=f"#{self.full_table_name}",
-                schema=self.schema,
-                records=context["records"],
-            )
-            # Merge data from Temp table to main table
-            self.logger.info(f"Merging data from temp table to {self.full_table_name}")
-            self.merge_upsert_from_table(
-                from_table_name=f"#{self.full_table_name}",
-                to_table_name=f"{self.full_table_name}",
-                schema=self.schema,
-                join_keys=self.key_properties,
-            )
+            # Flush any column adds/alters in a single round-trip.
+            with self.connector.begin_ddl_batch():
+                self.connector.prepare_table(
+                    full_table_name=self.full_table_name,
+                    schema=self.schema,
+                    primary_keys=self.key_properties,
+                    as_temp_table=False,
+                )
+            # One transaction per batch: a single commit (and log flush)
+            # instead of one per statement, and rollback on failure.
+            with self.connection.begin():
+                # Create a temp table (Creates from the table above)
+                self.logger.info(f"Creating temp table {self.full_table_name}")
+                self.connector.create_temp_table_from_table(
+                    from_table_name=self.full_table_name,
+                    join_keys=self.key_properties,
+                )
+                # Insert into temp table
+                self.logger.info("Inserting into temp table")
+                self.bulk_insert_records(
+                    full_table_name=f"#{self.full_table_name}",
+                    schema=self.schema,
+                    records=context["records"],
+                )
+                # Merge data from Temp table to main table
+                self.logger.info(
+                    f"Merging data from temp table to {self.full_table_name}"
+                )
+                self.merge_upsert_from_table(
+                    from_table_name=f"#{self.full_table_name}",
+                    to_table_name=f"{self.full_table_name}",
+                    schema=self.schema,
+                    join_keys=self.key_properties,
+                    batch_size=len(context["records"]),
+                )
 
         else:
-            self.bulk_insert_records(
-                full_table_name=self.full_table_name,
-                schema=self.schema,
-                records=context["records"],
-            )
+            with self.connection.begin():
+                self.bulk_insert_records(
+                    full_table_name=self.full_table_name,
+                    schema=self.schema,
+                    records=context["records"],
+                )
 
     def merge_upsert_from_table(
         self,
@@ -184,13 +484,22 @@ class mssqlSink(SQLSink):
         to_table_name: str,
         schema: dict,
         join_keys: List[str],
+        batch_size: Optional[int] = None,
     ) -> Optional[int]:
         """Merge upsert data from one table to another.
+
+        Rather than a single MERGE statement - whose plans degrade badly
+        against large targets - this updates matched rows, deletes them
+        from the staging table, and appends the remainder. Fresh staging
+        tables carry no statistics, so small batches ask for a recompiled
+        plan and large ones for a hash join outright.
+
         Args:
             from_table_name: The source table name.
             to_table_name: The destination table name.
             join_keys: The merge upsert keys, or `None` to append.
             schema: Singer Schema message.
+            batch_size: Number of staged records, if known.
         Return:
             The number of records copied, if detectable, or `None` if the API does not
             report number of records affected/inserted.
@@ -198,36 +507,33 @@ class mssqlSink(SQLSink):
         # TODO think about sql injeciton,
         # issue here https://github.com/MeltanoLabs/target-postgres/issues/22
 
-        join_condition = " and ".join(
-            [f"temp.{key} = target.{key}" for key in join_keys]
-        )
-
-        update_stmt = ", ".join(
-            [
-                f"target.{key} = temp.{key}"
-                for key in schema["properties"].keys()
-                if key not in join_keys
-            ]
-        )  # noqa
-
-        merge_sql = f"""
-            MERGE INTO {to_table_name} AS target
-            USING {from_table_name} AS temp
-            ON {join_condition}
-            WHEN MATCHED THEN
-                UPDATE SET
-                    { update_stmt }
-            WHEN NOT MATCHED THEN
-                INSERT ({", ".join(schema["properties"].keys())})
-                VALUES ({", ".join([f"temp.{key}" for key in schema["properties"].keys()])});
-        """
+        option_clause = _upsert_option_clause(batch_size)
 
-        if self.key_properties:
-            self.connection.execute(f"SET IDENTITY_INSERT { to_table_name } ON")
+        cache_key = (
+            to_table_name,
+            from_table_name,
+            tuple(schema["properties"]),
+            tuple(join_keys),
+            option_clause,
+        )
+        upsert_sql = self._merge_sql_cache.get(cache_key)
+        if upsert_sql is None:
+            upsert_sql = _render_upsert_sql(
+                from_table_name,
+                to_table_name,
+                list(schema["properties"]),
+                join_keys,
+                option_clause,
+                self.connection.engine.dialect.identifier_preparer.quote,
+            )
+            self._merge_sql_cache[cache_key] = upsert_sql
 
-        self.connection.execute(merge_sql)
+        has_identity = bool(
+            self.key_properties
+        ) and self.connector.table_has_identity_column(to_table_name)
 
-        if self.key_properties:
-            self.connection.execute(f"SET IDENTITY_INSERT { to_table_name } OFF")
+        if has_identity:
+            self._enable_identity_insert(to_table_name)
 
-        self.connection.execute("COMMIT")
+        with self.connection.begin():
+            self.connection.execute(upsert_sql)
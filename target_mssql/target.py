@@ -16,7 +16,33 @@ class Targetmssql(SQLTarget):
         th.Property(
             "sqlalchemy_url",
             th.StringType,
-            description="SQLAlchemy connection string",
+            description=(
+                "SQLAlchemy connection string; takes precedence over the "
+                "individual connection settings and selects the dialect "
+                "(e.g. mssql+pymssql for bulk-copy support)"
+            ),
+        ),
+        th.Property(
+            "driver",
+            th.StringType,
+            default="ODBC Driver 17 for SQL Server",
+            description=(
+                "ODBC driver used when the connection URL is built from the "
+                "individual connection settings; the named driver must be "
+                "installed on the host"
+            ),
+        ),
+        th.Property(
+            "bulk_insert_batch_size",
+            th.IntegerType,
+            default=10000,
+            description="Maximum number of rows sent per INSERT batch",
+        ),
+        th.Property(
+            "bulkcopy_batch_size",
+            th.IntegerType,
+            default=50000,
+            description="Rows per server-side batch on the bulk-copy path",
         ),
     ).to_dict()
 
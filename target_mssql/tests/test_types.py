@@ -0,0 +1,33 @@
+"""Type mapping tests that need no database connection."""
+
+# flake8: noqa
+import sqlalchemy
+
+from target_mssql.connector import mssqlConnector
+
+
+def make_connector() -> mssqlConnector:
+    return mssqlConnector(
+        config={"sqlalchemy_url": "mssql+pymssql://sa:P@55w0rd@localhost:1433/master"}
+    )
+
+
+def test_to_sql_type_anyof_schema_objects():
+    # "anyOf" holding schema objects (not bare type strings) must not crash
+    # and falls through to VARCHAR, same as before the type checks were
+    # rewritten around frozensets.
+    connector = make_connector()
+    jsonschema_type = {
+        "anyOf": [
+            {"type": "string", "format": "date-time"},
+            {"type": ["string", "null"]},
+        ]
+    }
+    sql_type = connector.to_sql_type(jsonschema_type)
+    assert isinstance(sql_type, sqlalchemy.types.VARCHAR)
+
+
+def test_to_sql_type_anyof_type_strings():
+    connector = make_connector()
+    sql_type = connector.to_sql_type({"anyOf": ["integer", "null"]})
+    assert isinstance(sql_type, sqlalchemy.types.INTEGER)
@@ -0,0 +1,45 @@
+"""SQL-shape tests for the upsert batch. No database connection needed."""
+
+# flake8: noqa
+from sqlalchemy.dialects import mssql
+
+from target_mssql.sinks import _render_upsert_sql, _upsert_option_clause
+
+QUOTE = mssql.dialect().identifier_preparer.quote
+
+
+def render(properties, join_keys, option_clause="OPTION (HASH JOIN)"):
+    return _render_upsert_sql(
+        "#orders", "orders", properties, join_keys, option_clause, QUOTE
+    )
+
+
+def test_update_then_delete_then_insert():
+    sql = render(["id", "name"], ["id"])
+    assert sql.index("UPDATE") < sql.index("DELETE") < sql.index("INSERT")
+    assert "FROM orders AS target WITH (TABLOCK, HOLDLOCK)" in sql
+    assert "INSERT INTO orders WITH (TABLOCK)" in sql
+    assert "SET target.name = temp.name" in sql
+    assert "ON temp.id = target.id" in sql
+    # The hint applies to the two joined statements, not the final INSERT.
+    assert sql.count("OPTION (HASH JOIN)") == 2
+
+
+def test_update_omitted_when_all_columns_are_keys():
+    sql = render(["id"], ["id"])
+    assert "UPDATE" not in sql
+    assert "DELETE temp" in sql
+    assert "INSERT INTO orders" in sql
+
+
+def test_reserved_identifiers_are_quoted():
+    sql = render(["id", "Order", "select"], ["id", "Order"])
+    assert "temp.[Order] = target.[Order]" in sql
+    assert "target.[select] = temp.[select]" in sql
+
+
+def test_option_clause_follows_batch_size():
+    assert _upsert_option_clause(1) == "OPTION (RECOMPILE)"
+    assert _upsert_option_clause(999) == "OPTION (RECOMPILE)"
+    assert _upsert_option_clause(1000) == "OPTION (HASH JOIN)"
+    assert _upsert_option_clause(None) == "OPTION (HASH JOIN)"